@@ -0,0 +1,42 @@
+# Times password hashing at different costs and a cached vs uncached login.
+# Run from the repo root: python benchmarks/bench_auth.py
+import os
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cinema_mysql
+
+
+def time_it(func, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench_hash_cost():
+    print("PBKDF2 cost (ms per hash):")
+    for iterations in (50_000, 100_000, 200_000, 400_000):
+        ms = time_it(lambda: cinema_mysql.hash_password("secret", iterations))
+        print(f"   {iterations:>7,} iterations: {ms:8.2f} ms")
+    print("-" * 30)
+
+
+def bench_cached_login():
+    # Fake employee lookup so no database is needed: (id, username, password, full_name)
+    row = (1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")
+    cinema_mysql.invalidate_login()
+    with mock.patch.object(cinema_mysql, "fetch_employee", return_value=(row, 2)):
+        first = time_it(lambda: cinema_mysql.authenticate("staff", "secret"), repeat=1)
+        cached = time_it(lambda: cinema_mysql.authenticate("staff", "secret"), repeat=1000)
+    print("Login (employee lookup faked):")
+    print(f"   first login:   {first:8.3f} ms")
+    print(f"   cached login:  {cached:8.3f} ms")
+    cinema_mysql.invalidate_login()
+
+
+if __name__ == "__main__":
+    bench_hash_cost()
+    bench_cached_login()
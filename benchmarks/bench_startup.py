@@ -0,0 +1,58 @@
+# Measures cold-start import time of the entry points with `python -X importtime`
+# and checks it against a budget. Run from the repo root: python benchmarks/bench_startup.py
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# module name -> (folder to run from, budget in milliseconds)
+ENTRY_POINTS = {
+    "cinema_mysql": (ROOT, 50),
+    "huffman": (os.path.join(ROOT, "compression_technique"), 20),
+    "huffman_rgb": (os.path.join(ROOT, "compression_technique"), 20),
+    "rle": (os.path.join(ROOT, "compression_technique"), 20),
+    "rle_rgb": (os.path.join(ROOT, "compression_technique"), 20),
+}
+
+# These should only be loaded when they are actually needed
+HEAVY_MODULES = ("mysql", "tkinter", "PIL", "pickle", "heapq")
+
+
+def import_time(module, cwd):
+    """
+    Returns (cumulative import time in ms, list of imported module names).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr}")
+    imported = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            total_us = int(cumulative)
+    return total_us / 1000, imported
+
+
+def main():
+    failed = False
+    print(f"{'entry point':<15}{'import (ms)':>12}{'budget':>8}  heavy modules loaded")
+    for module, (cwd, budget) in ENTRY_POINTS.items():
+        ms, imported = import_time(module, cwd)
+        heavy = sorted({name for name in imported if name.split(".")[0] in HEAVY_MODULES})
+        ok = ms <= budget and not heavy
+        failed = failed or not ok
+        print(f"{module:<15}{ms:>12.2f}{budget:>8}  {', '.join(heavy) or '-'}{'' if ok else '  <-- FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,13 @@
-import mysql.connector
-from tkinter import *
-from tkinter import messagebox, ttk
+import hashlib
+import hmac
+import os
+import time
+
+# Heavy modules are imported where they are used; see benchmarks/bench_startup.py
 
 
 def get_db():
+    import mysql.connector
     try:
         return mysql.connector.connect(
             host="localhost",
@@ -12,11 +16,200 @@ def get_db():
             database="cineplex_db"
         )
     except mysql.connector.Error as err:
-        messagebox.showerror("Database Error", f"Error: {err}")
+        _show_db_error(err)
         return None
 
 
+# --- AUTHENTICATION: SALTED HASHES + SESSION CACHE ---
+# Passwords are stored as "pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>".
+# Raise HASH_ITERATIONS to make hashing slower (safer); see benchmarks/bench_auth.py
+HASH_ITERATIONS = 200_000
+SESSION_TTL = 300  # seconds a verified login / employee row stays cached
+
+# Both caches are keyed by _cache_key(username)
+_employee_cache = {}   # username -> (expires_at, employee row, password column index)
+_session_cache = {}    # username -> (expires_at, stored hash, quick digest of password, employee row)
+_password_column_fits = None  # None until employees.password has been checked for upgrade_password
+
+
+def hash_password(password, iterations=None, salt=None):
+    iterations = iterations or HASH_ITERATIONS
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+    return f"pbkdf2_sha256${iterations}${salt.hex()}${digest.hex()}"
+
+
+def is_hashed(stored):
+    return stored.startswith("pbkdf2_sha256$")
+
+
+def verify_password(password, stored):
+    if not is_hashed(stored):
+        # Old rows still hold the plain password
+        return hmac.compare_digest(password.encode(), stored.encode())
+    try:
+        _, iterations, salt, expected = stored.split("$")
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), int(iterations))
+    except ValueError:
+        # Malformed hash row
+        return False
+    return hmac.compare_digest(digest.hex(), expected)
+
+
+def _quick_digest(password, stored):
+    # Cheap check used only for logins we already verified the slow way
+    return hashlib.sha256(stored.encode() + password.encode()).digest()
+
+
+def _cache_key(username):
+    # MySQL's default collation matches usernames case-insensitively
+    return username.casefold()
+
+
+def invalidate_login(username=None):
+    # Forget one user (e.g. after a password change) or everyone
+    if username is None:
+        _employee_cache.clear()
+        _session_cache.clear()
+    else:
+        _employee_cache.pop(_cache_key(username), None)
+        _session_cache.pop(_cache_key(username), None)
+
+
+def _db_error():
+    # Only imports mysql.connector once an exception actually has to be matched
+    import mysql.connector
+    return mysql.connector.Error
+
+
+def _show_db_error(err):
+    from tkinter import messagebox
+    messagebox.showerror("Database Error", f"Error: {err}")
+
+
+class DatabaseUnavailable(Exception):
+    # The employee could not be looked up; the error has already been shown to the user
+    pass
+
+
+def fetch_employee(username):
+    cached = _employee_cache.get(_cache_key(username))
+    if cached and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+
+    db = get_db()
+    if not db:
+        raise DatabaseUnavailable()
+    try:
+        cursor = db.cursor()
+        cursor.execute("SELECT * FROM employees WHERE username=%s", (username,))
+        row = cursor.fetchone()
+        pw_index = cursor.column_names.index("password")
+    except ValueError:
+        _show_db_error("employees table has no password column")
+        raise DatabaseUnavailable()
+    except _db_error() as err:
+        _show_db_error(err)
+        raise DatabaseUnavailable()
+    finally:
+        db.close()
+
+    if row:
+        _employee_cache[_cache_key(username)] = (time.monotonic() + SESSION_TTL, row, pw_index)
+    return row, pw_index
+
+
+def _hash_length():
+    # "pbkdf2_sha256$<iterations>$" + 32 hex salt + "$" + 64 hex digest
+    return len(f"pbkdf2_sha256${HASH_ITERATIONS}$") + 32 + 1 + 64
+
+
+def upgrade_password(username, password):
+    """
+    Replaces a plain-text password with a salted hash.
+    Returns the new hash, or None if the row was left as it was.
+
+    The hash is about 118 characters long. The width of employees.password is
+    checked once; if it is too narrow, upgrades are skipped (so nothing gets
+    truncated) and a warning is shown once. Widen the column with
+        ALTER TABLE employees MODIFY password VARCHAR(255) NOT NULL;
+    """
+    global _password_column_fits
+    if _password_column_fits is False:
+        return None
+    db = get_db()
+    if not db:
+        return None
+    try:
+        cursor = db.cursor()
+        if _password_column_fits is None:
+            cursor.execute(
+                "SELECT CHARACTER_MAXIMUM_LENGTH FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'employees' AND COLUMN_NAME = 'password'"
+            )
+            width = cursor.fetchone()
+            _password_column_fits = bool(width and width[0] is not None and width[0] >= _hash_length())
+            if not _password_column_fits:
+                from tkinter import messagebox
+                messagebox.showwarning(
+                    "Database Warning",
+                    "employees.password is too narrow for hashed passwords, so they are\n"
+                    "still stored as plain text. Run:\n"
+                    "ALTER TABLE employees MODIFY password VARCHAR(255) NOT NULL;"
+                )
+                return None
+        new_hash = hash_password(password)
+        cursor.execute("UPDATE employees SET password=%s WHERE username=%s", (new_hash, username))
+        db.commit()
+    except _db_error():
+        # Keep the plain-text row; the login itself already succeeded
+        return None
+    finally:
+        db.close()
+    invalidate_login(username)
+    return new_hash
+
+
+def authenticate(username, password):
+    """
+    Returns the employee row if the login is valid, otherwise None.
+    Raises DatabaseUnavailable if the employee could not be looked up.
+    """
+    key = _cache_key(username)
+    session = _session_cache.get(key)
+    if session and session[0] > time.monotonic():
+        if hmac.compare_digest(session[2], _quick_digest(password, session[1])):
+            return session[3]
+
+    cached = _employee_cache.get(key)
+    from_cache = bool(cached and cached[0] > time.monotonic())
+
+    row, pw_index = fetch_employee(username)
+    if row and from_cache and not verify_password(password, row[pw_index]):
+        # The cached row may be stale (password changed in the DB), so check once more
+        invalidate_login(username)
+        row, pw_index = fetch_employee(username)
+    if not row:
+        return None
+    stored = row[pw_index]
+    if not verify_password(password, stored):
+        return None
+
+    if not is_hashed(stored):
+        new_hash = upgrade_password(username, password)
+        if new_hash:
+            # Patch the row we already have instead of reading it back
+            stored = new_hash
+            row = row[:pw_index] + (new_hash,) + row[pw_index + 1:]
+            _employee_cache[key] = (time.monotonic() + SESSION_TTL, row, pw_index)
+
+    _session_cache[key] = (time.monotonic() + SESSION_TTL, stored, _quick_digest(password, stored), row)
+    return row
+
+
 def show_bookings_window():
+    from tkinter import Toplevel, Label, Button, BOTH, END, ttk
+
     # Create a new popup window
     view_win = Toplevel()
     view_win.title("Sales History - All Bookings")
@@ -59,6 +252,8 @@ def logout(current_window):
 
 # --- MAIN DASHBOARD WINDOW ---
 def open_booking_window(user_full_name):
+    from tkinter import Tk, Frame, Label, Button, Entry, X, LEFT, RIGHT, END, messagebox, ttk
+
     root = Tk()
     root.title("Cineplex Staff Dashboard")
     root.geometry("800x650")
@@ -134,23 +329,23 @@ def open_booking_window(user_full_name):
 
 # --- LOGIN SCREEN ---
 def show_login_screen():
+    from tkinter import Tk, Label, Button, Entry, messagebox
+
     login_win = Tk()
     login_win.title("Cineplex Login")
     login_win.geometry("350x300")
 
     def attempt_login():
         u, p = entry_user.get(), entry_pw.get()
-        db = get_db()
-        if db:
-            cursor = db.cursor()
-            cursor.execute("SELECT * FROM employees WHERE username=%s AND password=%s", (u, p))
-            result = cursor.fetchone()
-            db.close()
-            if result:
-                login_win.destroy()
-                open_booking_window(result[3])
-            else:
-                messagebox.showerror("Error", "Invalid login")
+        try:
+            result = authenticate(u, p)
+        except DatabaseUnavailable:
+            return  # get_db already showed "Database Error"
+        if result:
+            login_win.destroy()
+            open_booking_window(result[3])
+        else:
+            messagebox.showerror("Error", "Invalid login")
 
     Label(login_win, text="STAFF LOGIN", font=("Arial", 16, "bold")).pack(pady=20)
     Label(login_win, text="Username").pack()
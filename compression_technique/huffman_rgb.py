@@ -1,8 +1,4 @@
 import os
-from PIL import Image
-import heapq
-from collections import Counter
-import pickle # Used to estimate the size of the tree for statistics
 
 # 1. HUFFMAN NODE CLASS
 class HuffmanNode:
@@ -19,6 +15,8 @@ class HuffmanNode:
 # 2. HUFFMAN ENCODING
 
 def huffman_encode(data):
+    import heapq
+    from collections import Counter
 
     # 1. Calculate frequency of each pixel value
     freq = Counter(data)
@@ -83,6 +81,9 @@ def huffman_decode(encoded_bits, tree_root):
 
 
 def process_color_image_with_huffman(input_file):
+    from PIL import Image
+    import pickle # Used to estimate the size of the tree for statistics
+
     try:
         # 1. Load image
         img = Image.open(input_file).convert("RGB")
@@ -155,5 +156,6 @@ def process_color_image_with_huffman(input_file):
         print(f"Error: {e}")
 
 
-input_filename = "lion.jpg"
-process_color_image_with_huffman(input_filename)
\ No newline at end of file
+if __name__ == "__main__":
+    input_filename = "lion.jpg"
+    process_color_image_with_huffman(input_filename)
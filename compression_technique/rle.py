@@ -1,5 +1,4 @@
 import os
-from PIL import Image
 
 
 # 1. RUN-LENGTH ENCODING
@@ -36,6 +35,8 @@ def rle_decode(encoded_data):
 # MAIN FUNCTION
 
 def process_image_with_rle(input_file):
+    from PIL import Image
+
     try:
         # Load image and convert to grayscale ("L" mode)
         img = Image.open(input_file).convert("L")
@@ -98,5 +99,6 @@ def process_image_with_rle(input_file):
         print(f"An error occurred: {e}")
 
 
-input_filename = "forest_3.bmp"
-process_image_with_rle(input_filename)
\ No newline at end of file
+if __name__ == "__main__":
+    input_filename = "forest_3.bmp"
+    process_image_with_rle(input_filename)
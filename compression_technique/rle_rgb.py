@@ -1,5 +1,4 @@
 import os
-from PIL import Image
 
 
 # 1. RUN-LENGTH ENCODING
@@ -36,6 +35,8 @@ def rle_decode(encoded_data):
 # MAIN FUNCTION
 
 def process_color_image_with_rle(input_file):
+    from PIL import Image
+
     try:
         # 1. Load image and convert to RGB
         img = Image.open(input_file).convert("RGB")
@@ -99,5 +100,6 @@ def process_color_image_with_rle(input_file):
         print(f"Error: {e}")
 
 
-input_filename = "blackbuck.bmp"
-process_color_image_with_rle(input_filename)
\ No newline at end of file
+if __name__ == "__main__":
+    input_filename = "blackbuck.bmp"
+    process_color_image_with_rle(input_filename)
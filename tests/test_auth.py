@@ -0,0 +1,206 @@
+import importlib.util
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cinema_mysql
+
+
+class FakeCursor:
+    column_names = ("id", "username", "password", "full_name")
+
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+
+    def execute(self, query, params=()):
+        self.db.queries.append(query)
+        if self.db.fail_on and self.db.fail_on in query:
+            raise self.db.error
+        if query.startswith("SELECT * FROM employees"):
+            row = self.db.employees.get(params[0])
+            self.result = tuple(row) if row else None
+        elif "CHARACTER_MAXIMUM_LENGTH" in query:
+            self.result = (self.db.password_width,)
+        elif query.startswith("UPDATE employees SET password"):
+            self.db.employees[params[1]][2] = params[0]
+
+    def fetchone(self):
+        return self.result
+
+
+class FakeDB:
+    """
+    Stands in for the cineplex_db connection returned by get_db().
+    """
+
+    def __init__(self, employees, password_width=255):
+        self.employees = {row[1]: list(row) for row in employees}
+        self.password_width = password_width
+        self.queries = []
+        self.fail_on = None
+        self.error = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class AuthTestCase(unittest.TestCase):
+
+    def setUp(self):
+        cinema_mysql.invalidate_login()
+        self.addCleanup(cinema_mysql.invalidate_login)
+        iterations = mock.patch.object(cinema_mysql, "HASH_ITERATIONS", 1000)
+        iterations.start()
+        self.addCleanup(iterations.stop)
+        column_check = mock.patch.object(cinema_mysql, "_password_column_fits", None)
+        column_check.start()
+        self.addCleanup(column_check.stop)
+
+    def use_db(self, db):
+        patcher = mock.patch.object(cinema_mysql, "get_db", return_value=db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return db
+
+    def select_count(self, db):
+        return sum(q.startswith("SELECT * FROM employees") for q in db.queries)
+
+
+class TestPasswordHashing(AuthTestCase):
+
+    def test_hash_round_trip(self):
+        stored = cinema_mysql.hash_password("secret")
+        self.assertTrue(cinema_mysql.is_hashed(stored))
+        self.assertTrue(cinema_mysql.verify_password("secret", stored))
+        self.assertFalse(cinema_mysql.verify_password("wrong", stored))
+
+    def test_same_password_gets_different_salts(self):
+        self.assertNotEqual(cinema_mysql.hash_password("secret"), cinema_mysql.hash_password("secret"))
+
+    def test_plain_text_rows(self):
+        self.assertTrue(cinema_mysql.verify_password("secret", "secret"))
+        self.assertFalse(cinema_mysql.verify_password("wrong", "secret"))
+        self.assertTrue(cinema_mysql.verify_password("a$b$c$d", "a$b$c$d"))
+
+    def test_malformed_hash_is_rejected(self):
+        self.assertFalse(cinema_mysql.verify_password("x", "pbkdf2_sha256$abc$zz$00"))
+        self.assertFalse(cinema_mysql.verify_password("x", "pbkdf2_sha256$1000"))
+
+
+class TestAuthenticate(AuthTestCase):
+
+    def test_valid_and_invalid_login(self):
+        stored = cinema_mysql.hash_password("secret")
+        self.use_db(FakeDB([(1, "staff", stored, "Test Staff")]))
+        self.assertEqual(cinema_mysql.authenticate("staff", "secret")[3], "Test Staff")
+        self.assertIsNone(cinema_mysql.authenticate("staff", "wrong"))
+        self.assertIsNone(cinema_mysql.authenticate("nobody", "secret"))
+
+    def test_cached_login_skips_database(self):
+        db = self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")]))
+        cinema_mysql.authenticate("staff", "secret")
+        cinema_mysql.authenticate("staff", "secret")
+        self.assertEqual(self.select_count(db), 1)
+
+    def test_wrong_password_with_cached_session(self):
+        self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")]))
+        self.assertIsNotNone(cinema_mysql.authenticate("staff", "secret"))
+        self.assertIsNone(cinema_mysql.authenticate("staff", "wrong"))
+
+    def test_session_expires(self):
+        db = self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")]))
+        with mock.patch.object(cinema_mysql.time, "monotonic", return_value=1000.0):
+            cinema_mysql.authenticate("staff", "secret")
+        with mock.patch.object(cinema_mysql.time, "monotonic", return_value=1000.0 + cinema_mysql.SESSION_TTL + 1):
+            self.assertIsNotNone(cinema_mysql.authenticate("staff", "secret"))
+        self.assertEqual(self.select_count(db), 2)
+
+    def test_invalidate_login(self):
+        db = self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")]))
+        cinema_mysql.authenticate("staff", "secret")
+        db.employees["staff"][2] = cinema_mysql.hash_password("changed")
+        cinema_mysql.invalidate_login("staff")
+        self.assertIsNone(cinema_mysql.authenticate("staff", "secret"))
+        self.assertIsNotNone(cinema_mysql.authenticate("staff", "changed"))
+
+    def test_username_case_shares_cache(self):
+        db = self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("secret"), "Test Staff")]))
+        cinema_mysql.authenticate("staff", "secret")
+        db.employees["Staff"] = db.employees["staff"]  # MySQL matches either case
+        self.assertIsNotNone(cinema_mysql.authenticate("Staff", "secret"))
+        self.assertEqual(self.select_count(db), 1)
+        cinema_mysql.invalidate_login("STAFF")
+        self.assertIsNotNone(cinema_mysql.authenticate("Staff", "secret"))
+        self.assertEqual(self.select_count(db), 2)
+
+    def test_password_changed_in_database(self):
+        db = self.use_db(FakeDB([(1, "staff", cinema_mysql.hash_password("old"), "Test Staff")]))
+        self.assertIsNotNone(cinema_mysql.authenticate("staff", "old"))
+        db.employees["staff"][2] = cinema_mysql.hash_password("new")
+        self.assertIsNotNone(cinema_mysql.authenticate("staff", "new"))
+        self.assertEqual(self.select_count(db), 2)
+        self.assertIsNone(cinema_mysql.authenticate("staff", "old"))
+
+    def test_database_unavailable(self):
+        self.use_db(None)
+        with self.assertRaises(cinema_mysql.DatabaseUnavailable):
+            cinema_mysql.authenticate("staff", "secret")
+
+    def test_missing_password_column(self):
+        db = self.use_db(FakeDB([(1, "staff", "secret", "Test Staff")]))
+        with mock.patch.object(FakeCursor, "column_names", ("id", "username", "pw", "full_name")), \
+                mock.patch.object(db, "close") as close, \
+                mock.patch("tkinter.messagebox.showerror") as error:
+            with self.assertRaises(cinema_mysql.DatabaseUnavailable):
+                cinema_mysql.authenticate("staff", "secret")
+        error.assert_called_once()
+        close.assert_called_once()
+
+
+class TestLegacyUpgrade(AuthTestCase):
+
+    def test_plain_password_is_upgraded(self):
+        db = self.use_db(FakeDB([(1, "staff", "secret", "Test Staff")]))
+        row = cinema_mysql.authenticate("staff", "secret")
+        self.assertTrue(cinema_mysql.is_hashed(row[2]))
+        self.assertEqual(db.employees["staff"][2], row[2])
+        self.assertTrue(cinema_mysql.verify_password("secret", db.employees["staff"][2]))
+
+    def test_narrow_column_keeps_plain_row(self):
+        db = self.use_db(FakeDB([(1, "staff", "secret", "Test Staff")], password_width=50))
+        with mock.patch("tkinter.messagebox.showwarning") as warning, \
+                mock.patch.object(cinema_mysql, "hash_password") as hash_password:
+            self.assertIsNotNone(cinema_mysql.authenticate("staff", "secret"))
+            cinema_mysql.invalidate_login()
+            self.assertIsNotNone(cinema_mysql.authenticate("staff", "secret"))
+        self.assertEqual(db.employees["staff"][2], "secret")
+        warning.assert_called_once()
+        hash_password.assert_not_called()
+        self.assertEqual(sum("CHARACTER_MAXIMUM_LENGTH" in q for q in db.queries), 1)
+
+    def test_database_gone_after_verify(self):
+        self.use_db(FakeDB([(1, "staff", "secret", "Test Staff")]))
+        cinema_mysql.fetch_employee("staff")
+        cinema_mysql.get_db.return_value = None
+        self.assertEqual(cinema_mysql.authenticate("staff", "secret")[3], "Test Staff")
+
+    @unittest.skipUnless(importlib.util.find_spec("mysql"), "mysql-connector-python is not installed")
+    def test_update_error_keeps_plain_row(self):
+        import mysql.connector
+        db = self.use_db(FakeDB([(1, "staff", "secret", "Test Staff")]))
+        db.fail_on, db.error = "UPDATE", mysql.connector.Error("Data too long")
+        self.assertIsNotNone(cinema_mysql.authenticate("staff", "secret"))
+        self.assertEqual(db.employees["staff"][2], "secret")
+
+
+if __name__ == "__main__":
+    unittest.main()